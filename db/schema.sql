@@ -6,10 +6,14 @@ CREATE TABLE scraped_movies (
     poster_url TEXT
 );
 
+CREATE INDEX idx_scraped_movies_title ON scraped_movies(title);
+
 CREATE TABLE api_movies (
     id INTEGER PRIMARY KEY,
     title TEXT,
     genre TEXT,
     plot TEXT,
     poster_url TEXT
-);
\ No newline at end of file
+);
+
+CREATE INDEX idx_api_movies_title ON api_movies(title);
\ No newline at end of file
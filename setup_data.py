@@ -4,6 +4,7 @@ Setup script to populate both scraped_movies and api_movies tables.
 Run this once to populate the database before accessing the Flask endpoints.
 """
 
+import atexit
 import logging
 from utils.scraper import MovieScraper
 from utils.api_client import MovieAPIClient
@@ -21,6 +22,7 @@ def main():
     logger.info("\n[1/2] Populating scraped_movies table...")
     logger.info("-" * 70)
     scraper = MovieScraper(db_path="db/movies.db")
+    atexit.register(scraper.close)
     scraped_count = scraper.scrape_and_save(limit=10)
     logger.info(f"✓ Scraped {scraped_count} movies\n")
     
@@ -28,6 +30,7 @@ def main():
     logger.info("[2/2] Populating api_movies table...")
     logger.info("-" * 70)
     api_client = MovieAPIClient(db_path="db/movies.db")
+    atexit.register(api_client.close)
     api_count = api_client.fetch_popular_movies()
     logger.info(f"✓ Fetched {api_count} movies from OMDb API (or sample data)\n")
     
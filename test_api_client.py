@@ -4,6 +4,7 @@ Test script for MovieAPIClient class.
 Fetches movies from OMDb API and verifies data is stored in the database.
 """
 
+import atexit
 import sqlite3
 import logging
 from utils.api_client import MovieAPIClient
@@ -11,6 +12,11 @@ from utils.api_client import MovieAPIClient
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Shared across tests so the pooled OMDb connection is reused; cached responses
+# let repeat runs skip the network
+CLIENT = MovieAPIClient(db_path="db/movies.db", use_cache=True)
+atexit.register(CLIENT.close)
+
 
 def test_single_movie():
     """Test fetching a single movie."""
@@ -18,9 +24,7 @@ def test_single_movie():
     logger.info("Test 1: Fetching single movie (Inception)")
     logger.info("=" * 60)
     
-    client = MovieAPIClient(db_path="db/movies.db")
-    
-    movie = client.fetch_movie("Inception", year=2010)
+    movie = CLIENT.fetch_movie("Inception", year=2010)
     if movie:
         logger.info(f"✓ Fetched: {movie['title']}")
         logger.info(f"  Genre: {movie['genre']}")
@@ -36,9 +40,7 @@ def test_multiple_movies():
     logger.info("Test 2: Fetching and saving multiple popular movies")
     logger.info("=" * 60)
     
-    client = MovieAPIClient(db_path="db/movies.db")
-    
-    inserted = client.fetch_popular_movies()
+    inserted = CLIENT.fetch_popular_movies()
     logger.info(f"✓ Inserted {inserted} movies into api_movies table")
 
 
@@ -48,9 +50,7 @@ def test_search_movies():
     logger.info("Test 3: Searching for movies (search query)")
     logger.info("=" * 60)
     
-    client = MovieAPIClient(db_path="db/movies.db")
-    
-    results = client.search_movies("Batman", year=2008)
+    results = CLIENT.search_movies("Batman", year=2008)
     if results:
         logger.info(f"✓ Found {len(results)} search results")
         for i, movie in enumerate(results[:3], 1):
@@ -67,24 +67,23 @@ def test_database_verification():
     
     try:
         conn = sqlite3.connect("db/movies.db")
-        conn.row_factory = sqlite3.Row
         c = conn.cursor()
         
-        c.execute("SELECT COUNT(*) as count FROM api_movies")
-        count = c.fetchone()['count']
+        c.execute("SELECT COUNT(*) FROM api_movies")
+        (count,) = c.fetchone()
         logger.info(f"Total movies in api_movies table: {count}")
         
         if count > 0:
-            # Show all movies
-            c.execute("SELECT * FROM api_movies")
+            # Show up to the first 20 movies
+            c.execute("SELECT title, genre, plot, poster_url FROM api_movies LIMIT 20")
             movies = c.fetchall()
             
-            logger.info("\nAll movies in api_movies table:")
-            for i, movie in enumerate(movies, 1):
-                logger.info(f"{i}. {movie['title']}")
-                logger.info(f"   Genre: {movie['genre']}")
-                logger.info(f"   Plot: {movie['plot'][:80]}..." if len(movie['plot']) > 80 else f"   Plot: {movie['plot']}")
-                logger.info(f"   Poster: {movie['poster_url'][:60]}..." if len(movie['poster_url']) > 60 else f"   Poster: {movie['poster_url']}")
+            logger.info("\nMovies in api_movies table:")
+            for i, (title, genre, plot, poster_url) in enumerate(movies, 1):
+                logger.info(f"{i}. {title}")
+                logger.info(f"   Genre: {genre}")
+                logger.info(f"   Plot: {plot[:80]}..." if len(plot) > 80 else f"   Plot: {plot}")
+                logger.info(f"   Poster: {poster_url[:60]}..." if len(poster_url) > 60 else f"   Poster: {poster_url}")
         
         conn.close()
         logger.info("=" * 60)
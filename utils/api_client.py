@@ -1,11 +1,129 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sqlite3
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Any, Callable, Iterable, Optional, Dict, List
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    from json import loads as _json_loads
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # requests-cache is optional; fall back to an uncached session
+    CachedSession = None
 
 logger = logging.getLogger(__name__)
 
+# IMDb IDs for the curated popular titles, resolved once offline so
+# fetch_popular_movies can skip the title lookup and fetch details directly
+POPULAR_IMDB_IDS = {
+    "tt1375666": "Inception",
+    "tt0133093": "The Matrix",
+    "tt0109830": "Forrest Gump",
+    "tt0110912": "Pulp Fiction",
+    "tt0137523": "Fight Club",
+    "tt0099685": "Goodfellas",
+    "tt0111161": "The Shawshank Redemption",
+    "tt0068646": "The Godfather",
+    "tt0120338": "Titanic",
+    "tt0499549": "Avatar"
+}
+
+# Sample data used as a fallback when the OMDb API is unavailable.
+# Built once at import time so fallback lookups don't rebuild it per call.
+_SAMPLE_MOVIES = {
+    "Inception": {
+        "title": "Inception",
+        "genre": "Action, Sci-Fi, Thriller",
+        "plot": "A skilled thief who steals corporate secrets through the use of dream-sharing technology is given the inverse task of planting an idea into the mind of a C.E.O.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/2/2e/Inception_%282010%29_theatrical_poster.jpg"
+    },
+    "The Matrix": {
+        "title": "The Matrix",
+        "genre": "Action, Sci-Fi",
+        "plot": "A computer hacker learns from mysterious rebels about the true nature of his reality and his role in the war against its controllers.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/c/c1/The_Matrix_Poster.jpg"
+    },
+    "Forrest Gump": {
+        "title": "Forrest Gump",
+        "genre": "Drama, Romance",
+        "plot": "The presidencies of Kennedy and Johnson, the Vietnam War, the Watergate scandal and other historical events unfold from the perspective of an Alabama man with an IQ of 75.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/6/67/Forrest_Gump_poster.jpg"
+    },
+    "Pulp Fiction": {
+        "title": "Pulp Fiction",
+        "genre": "Crime, Drama",
+        "plot": "The lives of two mob hitmen, a boxer, a gangster and his wife, and a pair of diner bandits intertwine in four tales of violence and redemption.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/8/8b/Pulp_Fiction_%282.jpg"
+    },
+    "Fight Club": {
+        "title": "Fight Club",
+        "genre": "Drama",
+        "plot": "An insomniac office worker and a devil-may-care soapmaker form an underground fight club that evolves into much more.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/f/fc/Fight_Club_poster.jpg"
+    },
+    "Goodfellas": {
+        "title": "Goodfellas",
+        "genre": "Crime, Drama",
+        "plot": "The story of Henry Hill and his life in the mafia, covering his relationship with his wife Karen Hill and his mob partners, Tommy DeVito and Jimmy Conway.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/0/0b/Goodfellas.jpg"
+    },
+    "The Shawshank Redemption": {
+        "title": "The Shawshank Redemption",
+        "genre": "Drama",
+        "plot": "Two imprisoned men bond over a number of years, finding solace and eventual redemption through acts of common decency.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/8/81/ShawshankRedemptionMoviePoster.jpg"
+    },
+    "The Godfather": {
+        "title": "The Godfather",
+        "genre": "Crime, Drama",
+        "plot": "The aging patriarch of an organized crime dynasty transfers control of his clandestine empire to his youngest and most reluctant son.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/1/1c/Godfather_1972_poster.png"
+    },
+    "Titanic": {
+        "title": "Titanic",
+        "genre": "Drama, Romance",
+        "plot": "A seventeen-year-old aristocrat falls in love with a kind but poor artist aboard the luxurious, ill-fated R.M.S. Titanic.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/2/2f/Titanic_%281997%29_theatrical_poster.jpg"
+    },
+    "Avatar": {
+        "title": "Avatar",
+        "genre": "Action, Adventure, Fantasy, Sci-Fi",
+        "plot": "A paraplegic Marine dispatched to the moon Pandora on a unique mission becomes torn between following his orders and protecting the world he feels is his home.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/b/b0/Avatar_%282009%29_poster.jpg"
+    }
+}
+
+_SAMPLE_MOVIES_LOWER = {title.lower(): movie for title, movie in _SAMPLE_MOVIES.items()}
+
+_SAMPLE_SEARCH_LIST = [
+    {
+        "title": "Inception",
+        "genre": "Action, Sci-Fi, Thriller",
+        "plot": "A skilled thief who steals corporate secrets through the use of dream-sharing technology is given the inverse task of planting an idea into the mind of a C.E.O.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/2/2e/Inception_%282010%29_theatrical_poster.jpg"
+    },
+    {
+        "title": "The Dark Knight",
+        "genre": "Action, Crime, Drama",
+        "plot": "When the menace known as the Joker wreaks havoc and chaos on the people of Gotham, Batman must accept one of the greatest tests.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/1/1a/The_Dark_Knight_%282008_film%29.jpg"
+    },
+    {
+        "title": "Batman Begins",
+        "genre": "Action, Crime, Drama",
+        "plot": "When a crime in Gotham is too serious for the Gotham City Police Department, Batman is called upon to solve the case.",
+        "poster_url": "https://upload.wikimedia.org/wikipedia/en/1/1d/Batman_begins_poster.jpg"
+    }
+]
+
+_SAMPLE_SEARCH_LOWER = [(m["title"].lower(), m) for m in _SAMPLE_SEARCH_LIST]
+
 
 class MovieAPIClient:
     """
@@ -18,7 +136,7 @@ class MovieAPIClient:
     Register for a free API key to get started.
     """
 
-    def __init__(self, api_key: str = "e5c96a17", db_path: str = "db/movies.db"):
+    def __init__(self, api_key: str = "e5c96a17", db_path: str = "db/movies.db", use_cache: bool = False):
         """
         Initialize the MovieAPIClient.
         
@@ -26,11 +144,45 @@ class MovieAPIClient:
             api_key: OMDb API key (default is a demo key with limited requests)
                     For production, get your own free key from https://www.omdbapi.com/apikey.aspx
             db_path: Path to SQLite database
+            use_cache: Cache OMDb responses on disk for a day (requires requests-cache)
         """
         self.api_key = api_key
         self.db_path = db_path
         self.base_url = "https://www.omdbapi.com/"
         self.timeout = 10
+        self.max_workers = 8
+
+        # Reuse one pooled session so repeated OMDb calls keep the HTTPS connection alive.
+        # With use_cache, responses are also cached on disk for a day so repeated runs
+        # don't hit the network for unchanged titles. The API key is left out of the
+        # cache key so it is never written to the cache file.
+        if use_cache and CachedSession is None:
+            logger.warning("requests-cache is not installed; OMDb responses will not be cached")
+        if use_cache and CachedSession is not None:
+            self._session = CachedSession(
+                ".omdb_cache",
+                backend="sqlite",
+                expire_after=86400,
+                allowable_methods=["GET"],
+                ignored_parameters=["apikey"]
+            )
+        else:
+            self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate"
+        })
+
+    def close(self):
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
 
     def search_movies(self, query: str, year: Optional[int] = None, plot: str = "full") -> List[Dict]:
         """
@@ -59,7 +211,7 @@ class MovieAPIClient:
         
         try:
             logger.info(f"Searching OMDb API for: {query}")
-            response = requests.get(self.base_url, params=params, timeout=self.timeout)
+            response = self._session.get(self.base_url, params=params, timeout=self.timeout)
             
             # Check for 401 Unauthorized
             if response.status_code == 401:
@@ -68,18 +220,20 @@ class MovieAPIClient:
             
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             
             if data.get("Response") == "True" and "Search" in data:
                 search_results = data["Search"]
                 logger.info(f"Found {len(search_results)} search results for '{query}'")
                 
                 # For each search result, fetch full details using IMDb ID
-                for result in search_results[:5]:  # Limit to 5 to avoid excessive API calls
-                    if result.get("Type") == "movie":
-                        movie = self._fetch_movie_by_id(result.get("imdbID"))
-                        if movie:
-                            movies.append(movie)
+                imdb_ids = [
+                    result.get("imdbID")
+                    for result in search_results[:5]  # Limit to 5 to avoid excessive API calls
+                    if result.get("Type") == "movie"
+                ]
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    movies = [m for m in executor.map(self._fetch_movie_by_id, imdb_ids) if m]
             else:
                 logger.warning(f"No results found for '{query}': {data.get('Error', 'Unknown error')}")
                 return self._search_sample_movies(query)
@@ -113,9 +267,9 @@ class MovieAPIClient:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=self.timeout)
+            response = self._session.get(self.base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             if data.get("Response") == "True":
                 movie = self._parse_movie_data(data)
@@ -154,7 +308,7 @@ class MovieAPIClient:
         
         try:
             logger.info(f"Fetching movie: {title}" + (f" ({year})" if year else ""))
-            response = requests.get(self.base_url, params=params, timeout=self.timeout)
+            response = self._session.get(self.base_url, params=params, timeout=self.timeout)
             
             # Check for 401 Unauthorized (invalid API key)
             if response.status_code == 401:
@@ -167,7 +321,7 @@ class MovieAPIClient:
             
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             
             if data.get("Response") == "True":
                 movie = self._parse_movie_data(data)
@@ -213,76 +367,29 @@ class MovieAPIClient:
         Returns:
             Sample movie dict or None if title not found
         """
-        sample_movies = {
-            "Inception": {
-                "title": "Inception",
-                "genre": "Action, Sci-Fi, Thriller",
-                "plot": "A skilled thief who steals corporate secrets through the use of dream-sharing technology is given the inverse task of planting an idea into the mind of a C.E.O.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/2/2e/Inception_%282010%29_theatrical_poster.jpg"
-            },
-            "The Matrix": {
-                "title": "The Matrix",
-                "genre": "Action, Sci-Fi",
-                "plot": "A computer hacker learns from mysterious rebels about the true nature of his reality and his role in the war against its controllers.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/c/c1/The_Matrix_Poster.jpg"
-            },
-            "Forrest Gump": {
-                "title": "Forrest Gump",
-                "genre": "Drama, Romance",
-                "plot": "The presidencies of Kennedy and Johnson, the Vietnam War, the Watergate scandal and other historical events unfold from the perspective of an Alabama man with an IQ of 75.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/6/67/Forrest_Gump_poster.jpg"
-            },
-            "Pulp Fiction": {
-                "title": "Pulp Fiction",
-                "genre": "Crime, Drama",
-                "plot": "The lives of two mob hitmen, a boxer, a gangster and his wife, and a pair of diner bandits intertwine in four tales of violence and redemption.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/8/8b/Pulp_Fiction_%282.jpg"
-            },
-            "Fight Club": {
-                "title": "Fight Club",
-                "genre": "Drama",
-                "plot": "An insomniac office worker and a devil-may-care soapmaker form an underground fight club that evolves into much more.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/f/fc/Fight_Club_poster.jpg"
-            },
-            "Goodfellas": {
-                "title": "Goodfellas",
-                "genre": "Crime, Drama",
-                "plot": "The story of Henry Hill and his life in the mafia, covering his relationship with his wife Karen Hill and his mob partners, Tommy DeVito and Jimmy Conway.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/0/0b/Goodfellas.jpg"
-            },
-            "The Shawshank Redemption": {
-                "title": "The Shawshank Redemption",
-                "genre": "Drama",
-                "plot": "Two imprisoned men bond over a number of years, finding solace and eventual redemption through acts of common decency.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/8/81/ShawshankRedemptionMoviePoster.jpg"
-            },
-            "The Godfather": {
-                "title": "The Godfather",
-                "genre": "Crime, Drama",
-                "plot": "The aging patriarch of an organized crime dynasty transfers control of his clandestine empire to his youngest and most reluctant son.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/1/1c/Godfather_1972_poster.png"
-            },
-            "Titanic": {
-                "title": "Titanic",
-                "genre": "Drama, Romance",
-                "plot": "A seventeen-year-old aristocrat falls in love with a kind but poor artist aboard the luxurious, ill-fated R.M.S. Titanic.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/2/2f/Titanic_%281997%29_theatrical_poster.jpg"
-            },
-            "Avatar": {
-                "title": "Avatar",
-                "genre": "Action, Adventure, Fantasy, Sci-Fi",
-                "plot": "A paraplegic Marine dispatched to the moon Pandora on a unique mission becomes torn between following his orders and protecting the world he feels is his home.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/b/b0/Avatar_%282009%29_poster.jpg"
-            }
-        }
-        
-        # Search for the movie (case-insensitive)
-        for key, movie in sample_movies.items():
-            if key.lower() == title.lower():
-                logger.debug(f"Using sample data for: {title}")
-                return movie
+        movie = _SAMPLE_MOVIES_LOWER.get(title.lower())
+        if movie:
+            logger.debug(f"Using sample data for: {title}")
+        return movie
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the SQLite database tuned for bulk writes.
+        WAL mode is persistent, so readers such as the Flask routes also benefit.
         
-        return None
+        Returns:
+            Open sqlite3 connection
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache, so bulk loads stay in memory
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
 
     def save_to_db(self, movies: List[Dict]) -> int:
         """
@@ -298,35 +405,38 @@ class MovieAPIClient:
         if not Path(self.db_path).exists():
             raise FileNotFoundError(f"Database file not found: {self.db_path}")
         
+        conn = self._connect()
         try:
-            conn = sqlite3.connect(self.db_path)
             c = conn.cursor()
             
-            # Clear existing data
-            c.execute("DELETE FROM api_movies")
-            
-            # Insert new data
-            inserted = 0
-            for movie in movies:
-                try:
-                    c.execute(
-                        "INSERT INTO api_movies (title, genre, plot, poster_url) VALUES (?, ?, ?, ?)",
-                        (
-                            movie.get("title", ""),
-                            movie.get("genre", ""),
-                            movie.get("plot", ""),
-                            movie.get("poster_url", "")
-                        )
-                    )
-                    inserted += 1
-                except Exception as e:
-                    logger.warning(f"Error inserting movie {movie.get('title', 'Unknown')}: {e}")
+            rows = [
+                (
+                    movie.get("title", ""),
+                    movie.get("genre", ""),
+                    movie.get("plot", ""),
+                    movie.get("poster_url", "")
+                )
+                for movie in movies
+            ]
             
+            # Clear and reload the table in a single transaction, rebuilding the
+            # title index once after the load instead of updating it per row
+            c.execute("BEGIN")
+            c.execute("DROP INDEX IF EXISTS idx_api_movies_title")
+            c.execute("DELETE FROM api_movies")
+            c.executemany(
+                "INSERT INTO api_movies (title, genre, plot, poster_url) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            c.execute("CREATE INDEX idx_api_movies_title ON api_movies(title)")
             conn.commit()
+            inserted = len(rows)
             logger.info(f"Inserted {inserted} movies into api_movies table")
             return inserted
         
         except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
             logger.error(f"Error saving to database: {e}")
             raise
         
@@ -343,46 +453,48 @@ class MovieAPIClient:
         Returns:
             Number of movies inserted into database
         """
-        movies = []
-        
         logger.info(f"Fetching {len(movie_list)} movies from OMDb API...")
-        
-        for title in movie_list:
-            movie = self.fetch_movie(title, plot="full")
-            if movie and movie.get("title"):
-                movies.append(movie)
-        
-        if movies:
-            inserted = self.save_to_db(movies)
-            return inserted
-        else:
-            logger.warning("No movies were fetched")
-            return 0
+        return self._fetch_and_save(lambda title: self.fetch_movie(title, plot="full"), movie_list)
 
     def fetch_popular_movies(self) -> int:
         """
         Fetch a curated list of popular/well-known movies and save to database.
-        Uses hardcoded popular titles to avoid excessive API calls.
+        Uses hardcoded IMDb IDs to avoid excessive API calls.
         Falls back to sample data if OMDb API is unavailable.
         
         Returns:
             Number of movies inserted into database
         """
-        popular_titles = [
-            "Inception",
-            "The Matrix",
-            "Forrest Gump",
-            "Pulp Fiction",
-            "Fight Club",
-            "Goodfellas",
-            "The Shawshank Redemption",
-            "The Godfather",
-            "Titanic",
-            "Avatar"
-        ]
-        
-        logger.info(f"Fetching {len(popular_titles)} popular movies from OMDb API...")
-        return self.fetch_and_save_multiple(popular_titles)
+        logger.info(f"Fetching {len(POPULAR_IMDB_IDS)} popular movies from OMDb API...")
+        return self._fetch_and_save(
+            lambda item: self._fetch_popular_movie(*item),
+            POPULAR_IMDB_IDS.items()
+        )
+
+    def _fetch_popular_movie(self, imdb_id: str, title: str) -> Optional[Dict]:
+        """Fetch one popular movie by IMDb ID, falling back to its sample entry."""
+        return self._fetch_movie_by_id(imdb_id) or self._get_sample_movie(title)
+
+    def _fetch_and_save(self, fetch: Callable[[Any], Optional[Dict]], items: Iterable) -> int:
+        """
+        Run fetch over items on a thread pool and save the movies that came back.
+        
+        Args:
+            fetch: Callable returning a movie dict (or None) for one item
+            items: Items to pass to fetch
+        
+        Returns:
+            Number of movies inserted into database
+        """
+        # Requests are I/O-bound and independent, so overlap them on a thread pool
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            movies = [movie for movie in executor.map(fetch, items) if movie and movie.get("title")]
+        
+        if movies:
+            return self.save_to_db(movies)
+        else:
+            logger.warning("No movies were fetched")
+            return 0
 
     def _search_sample_movies(self, query: str) -> List[Dict]:
         """
@@ -395,28 +507,7 @@ class MovieAPIClient:
         Returns:
             List of matching sample movies
         """
-        sample_movies_list = [
-            {
-                "title": "Inception",
-                "genre": "Action, Sci-Fi, Thriller",
-                "plot": "A skilled thief who steals corporate secrets through the use of dream-sharing technology is given the inverse task of planting an idea into the mind of a C.E.O.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/2/2e/Inception_%282010%29_theatrical_poster.jpg"
-            },
-            {
-                "title": "The Dark Knight",
-                "genre": "Action, Crime, Drama",
-                "plot": "When the menace known as the Joker wreaks havoc and chaos on the people of Gotham, Batman must accept one of the greatest tests.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/1/1a/The_Dark_Knight_%282008_film%29.jpg"
-            },
-            {
-                "title": "Batman Begins",
-                "genre": "Action, Crime, Drama",
-                "plot": "When a crime in Gotham is too serious for the Gotham City Police Department, Batman is called upon to solve the case.",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/1/1d/Batman_begins_poster.jpg"
-            }
-        ]
-        
         query_lower = query.lower()
-        results = [m for m in sample_movies_list if query_lower in m["title"].lower()]
+        results = [m for title_lower, m in _SAMPLE_SEARCH_LOWER if query_lower in title_lower]
         logger.info(f"Found {len(results)} sample movies matching '{query}'")
         return results
\ No newline at end of file
@@ -1,16 +1,27 @@
 import socket
 import sys
+import time
 
 host = '127.0.0.1'
 port = 5000
 
-s = socket.socket()
-s.settimeout(2)
-try:
-    s.connect((host, port))
-    print('connect ok')
-except Exception as e:
-    print('connect failed:', type(e).__name__, e)
-    sys.exit(1)
-finally:
-    s.close()
+
+def wait_for_port(host, port, timeout=10):
+    """Poll until host:port accepts TCP connections; return False if timeout elapses first."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.02)
+    return False
+
+
+if __name__ == '__main__':
+    try:
+        socket.create_connection((host, port), timeout=0.25).close()
+        print('connect ok')
+    except OSError as e:
+        print('connect failed:', type(e).__name__, e)
+        sys.exit(1)
@@ -13,13 +13,13 @@ if not SCHEMA_PATH.exists():
 
 sql = SCHEMA_PATH.read_text(encoding='utf-8')
 
-conn = sqlite3.connect(DB_PATH)
+conn = sqlite3.connect(DB_PATH, isolation_level=None)
 try:
+    # page_size only takes effect before the first table is created
+    conn.execute("PRAGMA page_size=8192")
     conn.executescript(sql)
     print(f"Database created/updated at: {DB_PATH}")
-    cur = conn.cursor()
-    cur.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = [r[0] for r in cur.fetchall()]
+    tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
     if tables:
         print('Tables:')
         for t in tables:
@@ -1,5 +1,4 @@
 import threading
-import time
 import sys
 from pathlib import Path
 import requests
@@ -10,6 +9,7 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from app import app
+from utils.check_port import wait_for_port
 
 def run_server():
     app.run(host='127.0.0.1', port=5000, debug=False, use_reloader=False)
@@ -17,7 +17,11 @@ def run_server():
 thr = threading.Thread(target=run_server, daemon=True)
 thr.start()
 
-time.sleep(1)
+# Poll until the server accepts connections instead of sleeping a fixed amount
+if not wait_for_port('127.0.0.1', 5000):
+    print('server not reachable on 127.0.0.1:5000')
+    sys.exit(1)
+
 try:
     r = requests.get('http://127.0.0.1:5000/', timeout=3)
     print('status', r.status_code)
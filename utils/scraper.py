@@ -1,17 +1,113 @@
+import functools
+import re
 import sqlite3
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from bs4 import BeautifulSoup
+from typing import NamedTuple, Optional, Sequence
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-import time
+from selenium.common.exceptions import TimeoutException
 
 logger = logging.getLogger(__name__)
 
 
+class Movie(NamedTuple):
+    """A scraped movie; field order matches the scraped_movies insert columns."""
+    title: str
+    rating: str
+    year: str
+    poster_url: str
+
+
+# CSS selectors for the IMDb top 250 markup
+ROW_SELECTOR = "tr[data-testid='rating-cell-wrapper']"
+TITLE_LINK_SELECTOR = "a[data-testid='title']"
+RATING_SELECTOR = "span[data-testid='rating']"
+YEAR_SELECTOR = "span[data-testid='year']"
+METADATA_SELECTOR = "span[class*='cli-title-metadata']"
+YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
+# Selenium locator for the same movie rows _parse_movies reads, and a single-call
+# scroll to trigger lazy loading
+_ROW_LOCATOR = (By.CSS_SELECTOR, ROW_SELECTOR)
+_SCROLL_JS = "window.scrollBy(0, document.body.scrollHeight);"
+
+# Sample data used when live scraping fails; built once at import time
+_FALLBACK_MOVIES = (
+    Movie(
+        title="The Shawshank Redemption",
+        rating="9.3",
+        year="1994",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/8/81/ShawshankRedemptionMoviePoster.jpg"
+    ),
+    Movie(
+        title="The Godfather",
+        rating="9.2",
+        year="1972",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/1/1c/Godfather_1972_poster.png"
+    ),
+    Movie(
+        title="The Godfather Part II",
+        rating="9.0",
+        year="1974",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/0/3f/Godfather2-1974.jpg"
+    ),
+    Movie(
+        title="The Dark Knight",
+        rating="9.0",
+        year="2008",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/1/1a/The_Dark_Knight_%282008_film%29.jpg"
+    ),
+    Movie(
+        title="Pulp Fiction",
+        rating="8.9",
+        year="1994",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/8/8b/Pulp_Fiction_%282.jpg"
+    ),
+    Movie(
+        title="Forrest Gump",
+        rating="8.8",
+        year="1994",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/6/67/Forrest_Gump_poster.jpg"
+    ),
+    Movie(
+        title="Inception",
+        rating="8.8",
+        year="2010",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/2/2e/Inception_%282010%29_theatrical_poster.jpg"
+    ),
+    Movie(
+        title="Fight Club",
+        rating="8.8",
+        year="1999",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/f/fc/Fight_Club_poster.jpg"
+    ),
+    Movie(
+        title="The Matrix",
+        rating="8.7",
+        year="1999",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/c/c1/The_Matrix_Poster.jpg"
+    ),
+    Movie(
+        title="Goodfellas",
+        rating="8.7",
+        year="1990",
+        poster_url="https://upload.wikimedia.org/wikipedia/en/0/0b/Goodfellas.jpg"
+    )
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _sample_slice(limit: int) -> tuple:
+    """Return the first `limit` fallback movies, memoized so repeat calls share one tuple."""
+    return _FALLBACK_MOVIES[:limit]
+
+
 class MovieScraper:
     """
     Scrapes IMDb top 250 movies and stores them in the scraped_movies table.
@@ -22,17 +118,54 @@ class MovieScraper:
         self.db_path = db_path
         self.url = "https://www.imdb.com/chart/top/"
         self.driver = None
+        self._db_conn = None
+        self.max_workers = 8
+
+        # Reuse one pooled HTTP/2 client so repeated scrapes keep the HTTPS connection
+        # warm, and concurrent page fetches multiplex over a single connection
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4)
+        )
+        self.client = httpx.Client(
+            transport=transport,
+            timeout=15,
+            follow_redirects=True,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+                "Accept-Language": "en-US,en;q=0.9",
+            }
+        )
+
+    def close(self):
+        """Close the HTTP client, database connection, and Selenium driver, if any."""
+        self.client.close()
+        if self._db_conn is not None:
+            self._db_conn.close()
+            self._db_conn = None
+        self._close_driver()
 
     def _init_driver(self):
         """Initialize Selenium WebDriver with Chrome options."""
         if self.driver is None:
             try:
                 options = webdriver.ChromeOptions()
+                # Only the DOM is needed: don't wait for subresources or decode images
+                options.page_load_strategy = "eager"
+                options.add_argument("--headless=new")
+                options.add_argument("--disable-gpu")
+                options.add_argument("--no-sandbox")
+                options.add_argument("--disable-dev-shm-usage")
                 options.add_argument("--disable-blink-features=AutomationControlled")
                 options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+                options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2
+                })
                 self.driver = webdriver.Chrome(options=options)
             except Exception as e:
-                logger.warning(f"Failed to initialize Chrome driver: {e}. Trying with requests + BeautifulSoup instead.")
+                logger.warning(f"Failed to initialize Chrome driver: {e}. Trying with httpx + selectolax instead.")
                 self.driver = None
 
     def _close_driver(self):
@@ -44,27 +177,28 @@ class MovieScraper:
                 logger.warning(f"Error closing driver: {e}")
             self.driver = None
 
-    def scrape_movies(self, limit: int = 250, use_selenium: bool = False) -> list:
+    def scrape_movies(self, limit: int = 250, use_selenium: bool = False) -> Sequence[Movie]:
         """
         Scrape movies from IMDb top 250 page.
         
         Args:
             limit: Number of movies to scrape (default 250).
-            use_selenium: Whether to try Selenium first (default False, use requests).
+            use_selenium: Whether to try Selenium first (default False, use httpx).
         
         Returns:
-            List of dicts with keys: title, rating, year, poster_url
+            Sequence of Movie tuples with fields: title, rating, year, poster_url.
+            The fallback sample is a shared tuple, so treat the result as read-only.
         """
         movies = []
         
-        # Try requests + BeautifulSoup first (faster, more reliable)
+        # Try httpx + selectolax first (faster, more reliable)
         try:
-            movies = self._scrape_with_requests(limit)
+            movies = self._scrape_with_httpx(limit)
         except Exception as e:
-            logger.error(f"Requests scraping failed: {e}")
+            logger.error(f"HTTP scraping failed: {e}")
             movies = []
         
-        # Fallback: try Selenium if requests fails and use_selenium is True
+        # Fallback: try Selenium if httpx fails and use_selenium is True
         if not movies and use_selenium:
             self._init_driver()
             
@@ -86,142 +220,109 @@ class MovieScraper:
         logger.info(f"Fetching {self.url} with Selenium...")
         self.driver.get(self.url)
         
-        # Wait for the page to load
+        def rows_loaded(driver):
+            # Scroll to trigger lazy loading until enough movie rows are present
+            rows = driver.find_elements(*_ROW_LOCATOR)
+            if len(rows) >= limit:
+                return True
+            driver.execute_script(_SCROLL_JS)
+            return False
+        
+        # Return as soon as the rows are there instead of sleeping a fixed amount
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div[data-testid='rc-cell-content']"))
-            )
-        except Exception as e:
+            WebDriverWait(self.driver, 10, poll_frequency=0.2).until(rows_loaded)
+        except TimeoutException as e:
             logger.warning(f"Timeout waiting for elements: {e}")
         
-        time.sleep(2)  # Additional wait for lazy loading
-        
-        # Scroll to load more movies if needed
-        for _ in range(5):
-            self.driver.execute_script("window.scrollBy(0, 500);")
-            time.sleep(0.5)
-        
-        html = self.driver.page_source
-        soup = BeautifulSoup(html, "html.parser")
-        
-        movies = self._parse_movies(soup, limit)
+        tree = LexborHTMLParser(self.driver.page_source)
+        movies = self._parse_movies(tree, limit)
         return movies
 
-    def _scrape_with_requests(self, limit: int) -> list:
-        """Scrape using requests library + BeautifulSoup (fallback)."""
-        import requests
+    def _fetch_page(self, url: str) -> httpx.Response:
+        """Fetch one URL over the shared HTTP/2 client, raising on an HTTP error status."""
+        response = self.client.get(url)
+        response.raise_for_status()
+        return response
+
+    def _fetch_many(self, urls: list) -> list:
+        """
+        Fetch several URLs concurrently over the shared HTTP/2 client.
         
-        movies = []
-        logger.info(f"Fetching {self.url} with requests...")
+        A page that fails is logged and skipped so the pages that succeeded are
+        still returned, in the same order as urls. A single URL is fetched directly
+        and its errors propagate to the caller.
+        """
+        if len(urls) == 1:
+            return [self._fetch_page(urls[0])]
+        
+        responses = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            futures = {executor.submit(self._fetch_page, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    responses[url] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {url}: {e}")
+        return [responses[url] for url in urls if url in responses]
+
+    def _scrape_with_httpx(self, limit: int, urls: Optional[list] = None) -> Sequence[Movie]:
+        """
+        Scrape using httpx + selectolax (fallback).
+        
+        Args:
+            limit: Maximum number of movies to return across all pages.
+            urls: Pages to fetch concurrently (default is just self.url).
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-        }
+        Returns:
+            Parsed movies, or the shared fallback sample tuple if nothing was found.
+        """
+        urls = urls or [self.url]
+        movies = []
+        logger.info(f"Fetching {', '.join(urls)} with httpx...")
         
         try:
-            response = requests.get(self.url, headers=headers, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-            movies = self._parse_movies(soup, limit)
+            for response in self._fetch_many(urls):
+                tree = LexborHTMLParser(response.content)
+                movies.extend(self._parse_movies(tree, limit - len(movies)))
+                if len(movies) >= limit:
+                    break
             
             # IMDb page is heavily JavaScript-rendered, so if nothing was found,
             # log a note and suggest using Selenium
             if not movies:
                 logger.warning(
-                    "No movies found with requests. IMDb uses JavaScript rendering. "
+                    "No movies found with httpx. IMDb uses JavaScript rendering. "
                     "Falling back to sample data. For production, use Selenium or Playwright."
                 )
                 movies = self._get_fallback_sample_movies(limit)
         
-        except requests.exceptions.Timeout:
-            logger.error(f"Request timeout after 15s to {self.url}")
+        except httpx.TimeoutException:
+            logger.error(f"Request timeout after 15s to {', '.join(urls)}")
             logger.info("Using fallback sample data...")
             movies = self._get_fallback_sample_movies(limit)
         except Exception as e:
-            logger.error(f"Failed to fetch {self.url}: {e}")
+            logger.error(f"Failed to fetch {', '.join(urls)}: {e}")
             logger.info("Using fallback sample data...")
             movies = self._get_fallback_sample_movies(limit)
         
         return movies
 
-    def _get_fallback_sample_movies(self, limit: int) -> list:
+    def _get_fallback_sample_movies(self, limit: int) -> Sequence[Movie]:
         """
         Return sample movie data when live scraping fails.
         Useful for development and testing when IMDb is unreachable or JavaScript-rendered.
         
         In production, use Selenium or Playwright to handle JavaScript rendering.
+        Returns a shared immutable tuple of Movie entries.
         """
-        sample_movies = [
-            {
-                "title": "The Shawshank Redemption",
-                "rating": "9.3",
-                "year": "1994",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/8/81/ShawshankRedemptionMoviePoster.jpg"
-            },
-            {
-                "title": "The Godfather",
-                "rating": "9.2",
-                "year": "1972",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/1/1c/Godfather_1972_poster.png"
-            },
-            {
-                "title": "The Godfather Part II",
-                "rating": "9.0",
-                "year": "1974",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/0/3f/Godfather2-1974.jpg"
-            },
-            {
-                "title": "The Dark Knight",
-                "rating": "9.0",
-                "year": "2008",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/1/1a/The_Dark_Knight_%282008_film%29.jpg"
-            },
-            {
-                "title": "Pulp Fiction",
-                "rating": "8.9",
-                "year": "1994",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/8/8b/Pulp_Fiction_%282.jpg"
-            },
-            {
-                "title": "Forrest Gump",
-                "rating": "8.8",
-                "year": "1994",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/6/67/Forrest_Gump_poster.jpg"
-            },
-            {
-                "title": "Inception",
-                "rating": "8.8",
-                "year": "2010",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/2/2e/Inception_%282010%29_theatrical_poster.jpg"
-            },
-            {
-                "title": "Fight Club",
-                "rating": "8.8",
-                "year": "1999",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/f/fc/Fight_Club_poster.jpg"
-            },
-            {
-                "title": "The Matrix",
-                "rating": "8.7",
-                "year": "1999",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/c/c1/The_Matrix_Poster.jpg"
-            },
-            {
-                "title": "Goodfellas",
-                "rating": "8.7",
-                "year": "1990",
-                "poster_url": "https://upload.wikimedia.org/wikipedia/en/0/0b/Goodfellas.jpg"
-            }
-        ]
-        
-        logger.info(f"Using {len(sample_movies[:limit])} sample movies from fallback data")
-        return sample_movies[:limit]
+        movies = _sample_slice(limit)
+        logger.info(f"Using {len(movies)} sample movies from fallback data")
+        return movies
 
-    def _parse_movies(self, soup: BeautifulSoup, limit: int) -> list:
+    def _parse_movies(self, tree: LexborHTMLParser, limit: int) -> list:
         """
-        Parse movie data from BeautifulSoup object.
+        Parse movie data from a parsed selectolax page.
         
         Looks for movie rows in the IMDb top 250 page and extracts:
         - title
@@ -229,99 +330,98 @@ class MovieScraper:
         - year
         - poster_url
         """
-        movies = []
-        
         # IMDb top 250 uses a table-like structure. Try to find all movie entries.
         # The page structure uses divs with specific classes/attributes.
         
         # Attempt 1: Look for rows with movie data (newer IMDb layout)
-        rows = soup.find_all("tr", {"data-testid": "rating-cell-wrapper"})
+        rows = tree.css(ROW_SELECTOR)
         if not rows:
-            rows = soup.find_all("tr")
+            rows = tree.css("tr")
         
-        for row in rows[:limit]:
-            try:
-                movie = self._extract_movie_from_row(row)
-                if movie and movie.get("title"):
-                    movies.append(movie)
-            except Exception as e:
-                logger.debug(f"Error parsing row: {e}")
-                continue
+        # _extract_movie_from_row handles its own errors, so this never raises per row
+        movies = [
+            movie
+            for movie in (self._extract_movie_from_row(row) for row in rows[:limit])
+            if movie.title
+        ]
         
         logger.info(f"Parsed {len(movies)} movies from IMDb")
         return movies
 
-    def _extract_movie_from_row(self, row) -> dict:
+    def _extract_movie_from_row(self, row) -> Movie:
         """
         Extract movie data from a single table row.
         
         Returns:
-            Dict with keys: title, rating, year, poster_url
+            Movie with fields: title, rating, year, poster_url
         """
-        movie = {}
+        title = rating_text = year_text = poster_url = ""
         
         try:
             # Title and poster URL are typically in an 'a' tag with href
-            link = row.find("a", {"data-testid": "title"})
-            if not link:
-                link = row.find("a")
+            link = row.css_first(TITLE_LINK_SELECTOR) or row.css_first("a")
             
             if link:
-                movie["title"] = link.get_text(strip=True)
+                title = link.text(strip=True)
                 # Poster URL might be in an img tag within the link or nearby
-                img = link.find("img")
-                if img and img.get("src"):
-                    poster = img.get("src")
+                img = link.css_first("img")
+                poster = img.attributes.get("src") if img else None
+                if poster:
                     # IMDb returns placeholder-sized URLs; adjust to get full poster
                     if "._V1_" in poster:
-                        movie["poster_url"] = poster.split("._V1_")[0] + "._V1_UX182_CR0,0,182,268_AL_.jpg"
+                        poster_url = poster.split("._V1_")[0] + "._V1_UX182_CR0,0,182,268_AL_.jpg"
                     else:
-                        movie["poster_url"] = poster
-                else:
-                    movie["poster_url"] = ""
+                        poster_url = poster
             
             # Rating is typically in a span with a specific class
-            rating_span = row.find("span", {"data-testid": "rating"})
-            if not rating_span:
-                rating_spans = row.find_all("span")
-                for span in rating_spans:
-                    text = span.get_text(strip=True)
-                    if "." in text and len(text) <= 4:  # e.g., "9.2"
-                        rating_span = span
-                        break
-            
+            rating_span = row.css_first(RATING_SELECTOR)
             if rating_span:
-                movie["rating"] = rating_span.get_text(strip=True)
+                rating_text = rating_span.text(strip=True)
             else:
-                movie["rating"] = ""
+                for span in row.css("span"):
+                    text = span.text(strip=True)
+                    if "." in text and len(text) <= 4:  # e.g., "9.2"
+                        rating_text = text
+                        break
             
             # Year is typically in a span or td with year pattern (e.g., "1994")
-            year_text = ""
-            year_cell = row.find("span", {"data-testid": "year"})
+            year_cell = row.css_first(YEAR_SELECTOR)
             if not year_cell:
-                # Try to find any 4-digit year in the row
-                all_text = row.get_text()
-                import re
-                years = re.findall(r"\b(19|20)\d{2}\b", all_text)
-                if years:
-                    year_text = years[0]
+                # Try to find a 4-digit year, scanning only the metadata span when present
+                metadata = row.css_first(METADATA_SELECTOR)
+                year_match = YEAR_RE.search((metadata or row).text())
+                if year_match:
+                    year_text = year_match.group()
             else:
-                year_text = year_cell.get_text(strip=True)
-            
-            movie["year"] = year_text
+                year_text = year_cell.text(strip=True)
         
         except Exception as e:
             logger.debug(f"Error extracting movie data: {e}")
         
-        return movie
+        return Movie(title, rating_text, year_text, poster_url)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return the scraper's SQLite connection, opening it on first use.
+        The connection is kept open across saves and tuned for bulk writes;
+        isolation_level=None leaves transaction control to explicit BEGIN/COMMIT.
+        """
+        if self._db_conn is None:
+            self._db_conn = sqlite3.connect(self.db_path, isolation_level=None)
+            self._db_conn.execute("PRAGMA journal_mode=WAL")
+            self._db_conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_conn.execute("PRAGMA temp_store=MEMORY")
+            self._db_conn.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+            self._db_conn.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped I/O
+        return self._db_conn
 
-    def save_to_db(self, movies: list) -> int:
+    def save_to_db(self, movies: Sequence[Movie]) -> int:
         """
         Save scraped movies to the scraped_movies table.
         Clears the table before inserting new data.
         
         Args:
-            movies: List of movie dicts with keys: title, rating, year, poster_url
+            movies: Sequence of Movie tuples with fields: title, rating, year, poster_url
         
         Returns:
             Number of movies inserted
@@ -329,40 +429,32 @@ class MovieScraper:
         if not Path(self.db_path).exists():
             raise FileNotFoundError(f"Database file not found: {self.db_path}")
         
+        conn = self._connect()
         try:
-            conn = sqlite3.connect(self.db_path)
             c = conn.cursor()
             
-            # Clear existing data
+            # Clear and reload in one transaction. An unqualified DELETE already
+            # gets SQLite's truncate optimization; dropping the title index first
+            # means it is built once after the load instead of updated per row.
+            # IMMEDIATE takes the write lock up front instead of upgrading mid-transaction
+            c.execute("BEGIN IMMEDIATE")
+            c.execute("DROP INDEX IF EXISTS idx_scraped_movies_title")
             c.execute("DELETE FROM scraped_movies")
-            
-            # Insert new data
-            inserted = 0
-            for movie in movies:
-                try:
-                    c.execute(
-                        "INSERT INTO scraped_movies (title, rating, year, poster_url) VALUES (?, ?, ?, ?)",
-                        (
-                            movie.get("title", ""),
-                            movie.get("rating", ""),
-                            movie.get("year", ""),
-                            movie.get("poster_url", "")
-                        )
-                    )
-                    inserted += 1
-                except Exception as e:
-                    logger.warning(f"Error inserting movie {movie.get('title', 'Unknown')}: {e}")
-            
+            c.executemany(
+                "INSERT INTO scraped_movies (title, rating, year, poster_url) VALUES (?, ?, ?, ?)",
+                movies  # Each Movie is already a tuple in column order
+            )
+            c.execute("CREATE INDEX idx_scraped_movies_title ON scraped_movies(title)")
             conn.commit()
+            inserted = len(movies)
             logger.info(f"Inserted {inserted} movies into scraped_movies table")
             return inserted
         
         except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
             logger.error(f"Error saving to database: {e}")
             raise
-        
-        finally:
-            conn.close()
 
     def scrape_and_save(self, limit: int = 250) -> int:
         """
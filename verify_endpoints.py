@@ -3,10 +3,14 @@
 Verify that the Flask endpoints are returning data.
 """
 
-import time
+import sys
 import requests
+from utils.check_port import wait_for_port
 
-time.sleep(2)  # Give server time to be ready
+# Wait until the server is accepting connections
+if not wait_for_port('127.0.0.1', 5000):
+    print("server not reachable on 127.0.0.1:5000")
+    sys.exit(1)
 
 print("Testing Flask endpoints...\n")
 